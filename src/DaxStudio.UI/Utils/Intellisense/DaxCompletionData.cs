@@ -130,7 +130,7 @@ private LinePosition GetPreceedingWordSegment(ICSharpCode.AvalonEdit.Document.ID
             //line = textArea.Document.GetText(docLine.Offset, loc.Column);
             line = document.GetText(docLine.Offset, docLine.Length);
 
-            Log.Verbose("{class} {method} {message}", "DaxCompletionData", "GetPreceedingWordSegment", "line: " + line);
+            Log.Verbose("{class} {method} line: {line}", "DaxCompletionData", "GetPreceedingWordSegment", line);
             var daxState = DaxLineParser.ParseLine(line, loc.Column, 0);
             //TODO - look ahead to see if we have a table/column/function end character that we should replace upto
             return DaxLineParser.GetPreceedingWordSegment(docLine.Offset, loc.Column, line, daxState);
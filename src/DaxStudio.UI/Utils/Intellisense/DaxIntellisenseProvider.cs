@@ -417,7 +417,7 @@ private void ShowKeywordInsightWindow(int offset, string keyword)
         {
             try
             {
-                Log.Verbose($"Showing InsightWindow for keyword: {keyword}");
+                Log.Verbose("Showing InsightWindow for keyword: {keyword}", keyword);
                 //_editor.InsightWindow?.Close();
                 _editor.InsightWindow = null;
                 _editor.InsightWindow = new InsightWindow(_editor.TextArea);